@@ -0,0 +1,27 @@
+"""
+``python -m ntfy_wrapper``: same as the ``py-ntfy`` command.
+"""
+import sys
+
+
+def main():
+    """
+    Entry point of the ``py-ntfy`` command.
+
+    ``--version`` is answered without importing the CLI: ``typer`` and ``rich`` make
+    up most of the command's startup time. Everything else is handled by
+    ``ntfy_wrapper.cli``.
+    """
+    if sys.argv[1:] in (["--version"], ["-V"]):
+        from ntfy_wrapper import __version__
+
+        sys.stdout.write(f"py-ntfy {__version__}\n")
+        return
+
+    from ntfy_wrapper.cli import main as cli_main
+
+    cli_main()
+
+
+if __name__ == "__main__":
+    main()
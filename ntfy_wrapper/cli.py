@@ -1,23 +1,26 @@
 """
 ``py-ntfy`` command-line interface.
 """
-from typing import Optional
+import copy
+import sys
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional
 
 import typer
 
-
-from ntfy_wrapper import Notifier
 from ntfy_wrapper.utils import (
+    default_conf,
     generate_topic,
     load_conf,
     write_conf,
-    code,
+    code_path,
+    code_str,
     print,
     get_conf_path,
+    update_conf,
     KEYS,
 )
 
-
 app = typer.Typer()
 add_app = typer.Typer()
 remove_app = typer.Typer()
@@ -35,6 +38,40 @@ app.add_typer(
 )
 
 
+def _print_version(value: bool):
+    """
+    Eager ``--version`` callback: prints the installed version and exits before
+    any command runs.
+
+    Args:
+        value (bool): Whether ``--version`` was passed.
+
+    Raises:
+        typer.Exit: After printing the version.
+    """
+    if value:
+        from ntfy_wrapper import __version__
+
+        typer.echo(f"py-ntfy {__version__}")
+        raise typer.Exit()
+
+
+@app.callback()
+def callback(
+    version: Optional[bool] = typer.Option(
+        None,
+        "--version",
+        "-V",
+        callback=_print_version,
+        is_eager=True,
+        help="Show the version and exit.",
+    ),
+):
+    """
+    py-ntfy: manage your ntfy-wrapper configuration and send notifications.
+    """
+
+
 @app.command()
 def init(conf_path: Optional[str] = None, force: bool = False):
     """
@@ -44,19 +81,20 @@ def init(conf_path: Optional[str] = None, force: bool = False):
     Use --force to overwrite an existing configuration file.
     """
     conf_path = get_conf_path(conf_path)
-    if conf_path.exists() and not force:
-        print(f"Config file already exists at {code(conf_path)}")
+    exists = conf_path.exists()
+    if exists and not force:
+        print(f"Config file already exists at {code_path(conf_path)}")
         raise typer.Abort()
     topic = generate_topic()
-    base_conf = load_conf()
+    # --force keeps the existing emails and defaults, only the topics are reset
+    base_conf = load_conf(conf_path) if exists else default_conf()
     base_conf["topics"] = [topic]
     write_conf(conf_path, base_conf)
     print(
-        f"🔑 Your first topic is {code(topic)}."
-        + " Use it to subscribe to notifications!",
-        style="yellow",
+        f"[yellow]🔑 Your first topic is {code_str(topic)}."
+        + " Use it to subscribe to notifications![/yellow]\n"
+        + f"[green]🎉 Config file created at {code_path(conf_path)}[/green]"
     )
-    print(f"🎉 Config file created at {code(conf_path)}", style="green")
 
 
 @app.command()
@@ -67,18 +105,158 @@ def clean(conf_path: Optional[str] = None, force: bool = False):
     Use --force to skip the confirmation prompt.
     """
     conf_path = get_conf_path(conf_path)
-    if conf_path.exists():
+    try:
         if not force:
+            # only prompt for files that exist: stat() raises FileNotFoundError
+            conf_path.stat()
             confirm = typer.confirm(
                 f"Are you sure you want to delete {str(conf_path)}?"
             )
             if not confirm:
                 raise typer.Abort()
         conf_path.unlink()
-    else:
-        print(f"Config file does not exist at {code(conf_path)}")
+    except FileNotFoundError:
+        print(f"Config file does not exist at {code_path(conf_path)}")
         raise typer.Abort()
-    print(f"🎉 Config file removed from \n {code(conf_path)}", style="green")
+    print(f"🎉 Config file removed from \n {code_path(conf_path)}", style="green")
+
+
+# batch operation target -> configuration key
+BATCH_TARGETS = {"topic": "topics", "email": "emails", "base_url": "base_url"}
+
+
+def _index_targets(conf: dict, keys: Iterable[str]) -> dict:
+    """
+    Turns the ``keys`` lists of targets (topics, emails or base urls) of ``conf``
+    into insertion-ordered dicts used as ordered sets, so that adding or removing a
+    target does not scan the whole list. Use ``_unindex_targets`` before writing
+    ``conf``. Other keys are left untouched.
+
+    Args:
+        conf (dict): The configuration to update in place.
+        keys (Iterable[str]): The target keys about to be modified.
+
+    Returns:
+        dict: ``conf``
+    """
+    for key in keys:
+        if key in conf:
+            conf[key] = dict.fromkeys(conf[key])
+    return conf
+
+
+def _unindex_targets(conf: dict, keys: Iterable[str]) -> dict:
+    """
+    Reverts ``_index_targets``: turns the ``keys`` targets of ``conf`` back into
+    lists.
+
+    Args:
+        conf (dict): The configuration to update in place.
+        keys (Iterable[str]): The target keys given to ``_index_targets``.
+
+    Returns:
+        dict: ``conf``
+    """
+    for key in keys:
+        if key in conf:
+            conf[key] = list(conf[key])
+    return conf
+
+
+def _apply_add(conf: dict, key: str, value: str) -> bool:
+    """
+    Adds ``value`` to the ``conf[key]`` targets (topics, emails or base urls),
+    unless it is already there. ``conf`` must have been indexed with
+    ``_index_targets``.
+
+    Args:
+        conf (dict): The configuration to update in place.
+        key (str): One of ``"topics"``, ``"emails"`` or ``"base_url"``.
+        value (str): The target to add.
+
+    Returns:
+        bool: Whether ``conf`` was modified.
+    """
+    targets = conf.setdefault(key, {})
+    if value in targets:
+        return False
+    targets[value] = None
+    return True
+
+
+def _apply_remove(conf: dict, key: str, value: str) -> bool:
+    """
+    Removes ``value`` from the ``conf[key]`` targets (topics, emails or base urls),
+    if it is there. ``conf`` must have been indexed with ``_index_targets``.
+
+    Args:
+        conf (dict): The configuration to update in place.
+        key (str): One of ``"topics"``, ``"emails"`` or ``"base_url"``.
+        value (str): The target to remove.
+
+    Returns:
+        bool: Whether ``conf`` was modified.
+    """
+    targets = conf.get(key, {})
+    if value not in targets:
+        return False
+    del targets[value]
+    return True
+
+
+def _apply_add_default(conf: dict, key: str, value: str) -> bool:
+    """
+    Sets the ``Notifier.notify(..)`` default ``key`` to ``value``.
+
+    Args:
+        conf (dict): The configuration to update in place.
+        key (str): The default to set. Must be in ``KEYS["notify_defaults"]``.
+        value (str): Its value.
+
+    Returns:
+        bool: Whether ``conf`` was modified.
+    """
+    if conf.get(key) == value:
+        return False
+    conf[key] = value
+    return True
+
+
+def _apply_remove_default(conf: dict, key: str) -> bool:
+    """
+    Removes the ``Notifier.notify(..)`` default ``key``, if it is set.
+
+    Args:
+        conf (dict): The configuration to update in place.
+        key (str): The default to remove.
+
+    Returns:
+        bool: Whether ``conf`` was modified.
+    """
+    return conf.pop(key, None) is not None
+
+
+def _update_targets(conf_path: Path, apply: Callable[..., bool], *args: str) -> bool:
+    """
+    Applies ``_apply_add`` or ``_apply_remove`` to the configuration file's targets.
+    The file is read once and only written if it changed.
+
+    Args:
+        conf_path (Path): The path to the configuration file.
+        apply (Callable[..., bool]): ``_apply_add`` or ``_apply_remove``.
+        *args (str): The configuration key and the target to add or remove.
+
+    Returns:
+        bool: Whether the configuration changed.
+    """
+
+    def update(conf: dict) -> bool:
+        key = args[0]
+        changed = apply(_index_targets(conf, [key]), *args)
+        _unindex_targets(conf, [key])
+        return changed
+
+    return update_conf(conf_path, update)
 
 
 @add_app.command("topic")
@@ -90,17 +268,10 @@ def add_topic(topic: str, conf_path: Optional[str] = None):
     conf_path = get_conf_path(conf_path)
     if not conf_path.exists():
         raise typer.BadParameter(f"Config file not found at {str(conf_path)}")
-    conf = load_conf(conf_path)
-    topics = conf.get("topics", [])
-    if topic not in topics:
-        topics.append(topic)
-        conf["topics"] = topics
-    else:
+    if not _update_targets(conf_path, _apply_add, "topics", topic):
         print(f"Topic {topic} already exists.")
         raise typer.Abort()
-
-    write_conf(conf_path, conf)
-    print(f"🎉 Topic {code(topic)} added to {code(conf_path)}", style="green")
+    print(f"🎉 Topic {code_str(topic)} added to {code_path(conf_path)}", style="green")
 
 
 @add_app.command("email")
@@ -112,15 +283,10 @@ def add_email(email: str, conf_path: Optional[str] = None):
     conf_path = get_conf_path(conf_path)
     if not conf_path.exists():
         raise typer.Abort(f"Config file not found at {str(conf_path)}")
-    conf = load_conf(conf_path)
-    emails = conf.get("emails", [])
-    if email not in emails:
-        emails.append(email)
-        conf["emails"] = emails
-    else:
+    if not _update_targets(conf_path, _apply_add, "emails", email):
         print(f"email {email} already exists.")
         raise typer.Abort()
-    write_conf(conf_path, conf)
+    print(f"🎉 Email {code_str(email)} added to {code_path(conf_path)}", style="green")
 
 
 @add_app.command("base_url")
@@ -132,16 +298,10 @@ def add_base_url(url: str, conf_path: Optional[str] = None):
     conf_path = get_conf_path(conf_path)
     if not conf_path.exists():
         raise typer.Abort(f"Config file not found at {str(conf_path)}")
-    conf = load_conf(conf_path)
-    base_url = conf.get("base_url", [])
-    if url not in base_url:
-        base_url.append(url)
-        conf["base_url"] = base_url
-    else:
+    if not _update_targets(conf_path, _apply_add, "base_url", url):
         print(f"base_url {url} already exists.")
         raise typer.Abort()
-    write_conf(conf_path, conf)
-    print(f"🎉 URL {code(url)} added to {code(conf_path)}", style="green")
+    print(f"🎉 URL {code_str(url)} added to {code_path(conf_path)}", style="green")
 
 
 @add_app.command("default")
@@ -152,21 +312,28 @@ def add_default(key: str, value: str, conf_path: Optional[str] = None):
     """
     if key not in KEYS["notify_defaults"]:
         raise typer.BadParameter(
-            f"key must be one of {KEYS['notify_defaults']}, not '{key}'"
+            f"key must be one of {sorted(KEYS['notify_defaults'])}, not '{key}'"
         )
     conf_path = get_conf_path(conf_path)
     if not conf_path.exists():
         raise typer.BadParameter(f"Config file not found at {str(conf_path)}")
-    conf = load_conf(conf_path)
-    if key in conf:
-        print(
-            f"Default {code(key)} already exists: {code(conf[key])}."
-            + "\nOverwriting.",
-        )
-    conf[key] = value
-    write_conf(conf_path, conf)
+
+    def update(conf: dict) -> bool:
+        if conf.get(key) == value:
+            print(f"Default {code_str(key)} is already set to {code_str(value)}.")
+            return False
+        if key in conf:
+            print(
+                f"Default {code_str(key)} already exists: {code_str(conf[key])}."
+                + "\nOverwriting.",
+            )
+        return _apply_add_default(conf, key, value)
+
+    if not update_conf(conf_path, update):
+        return
     print(
-        f"🎉 Default {code(str(key)+'='+str(value))} added to {code(conf_path)}",
+        f"🎉 Default {code_str(str(key)+'='+str(value))} added to "
+        + code_path(conf_path),
         style="green",
     )
 
@@ -180,15 +347,13 @@ def remove_topic(topic: str, conf_path: Optional[str] = None):
     conf_path = get_conf_path(conf_path)
     if not conf_path.exists():
         raise typer.BadParameter(f"Config file not found at {str(conf_path)}")
-    conf = load_conf(conf_path)
-    topics = conf.get("topics", [])
-    if topic in topics:
-        topics.remove(topic)
-        conf["topics"] = topics
-        write_conf(conf_path, conf)
-        print(f"🎉 Topic {code(topic)} removed from {code(conf_path)}", style="green")
+    if _update_targets(conf_path, _apply_remove, "topics", topic):
+        print(
+            f"🎉 Topic {code_str(topic)} removed from {code_path(conf_path)}",
+            style="green",
+        )
     else:
-        print(f"Topic {code(topic)} does not exist. Ignoring.")
+        print(f"Topic {code_str(topic)} does not exist. Ignoring.")
 
 
 @remove_app.command("email")
@@ -200,15 +365,13 @@ def remove_email(email: str, conf_path: Optional[str] = None):
     conf_path = get_conf_path(conf_path)
     if not conf_path.exists():
         raise typer.BadParameter(f"Config file not found at {str(conf_path)}")
-    conf = load_conf(conf_path)
-    emails = conf.get("emails", [])
-    if email in emails:
-        emails.remove(email)
-        conf["emails"] = emails
-        write_conf(conf_path, conf)
-        print(f"🎉 Email {code(email)} removed from {code(conf_path)}", style="green")
+    if _update_targets(conf_path, _apply_remove, "emails", email):
+        print(
+            f"🎉 Email {code_str(email)} removed from {code_path(conf_path)}",
+            style="green",
+        )
     else:
-        print(f"Email {code(email)} does not exist. Ignoring.", style="yellow")
+        print(f"Email {code_str(email)} does not exist. Ignoring.", style="yellow")
 
 
 @remove_app.command("base_url")
@@ -220,15 +383,13 @@ def remove_base_url(url: str, conf_path: Optional[str] = None):
     conf_path = get_conf_path(conf_path)
     if not conf_path.exists():
         raise typer.BadParameter(f"Config file not found at {str(conf_path)}")
-    conf = load_conf(conf_path)
-    base_url = conf.get("base_url", "")
-    if url in base_url:
-        base_url = [u.strip() for u in base_url.split(",") if u.strip() != url.strip()]
-        conf["base_url"] = ", ".join(base_url)
-        write_conf(conf_path, conf)
-        print(f"🎉 URL {code(url)} removed from {code(conf_path)}", style="green")
+    if _update_targets(conf_path, _apply_remove, "base_url", url):
+        print(
+            f"🎉 URL {code_str(url)} removed from {code_path(conf_path)}",
+            style="green",
+        )
     else:
-        print(f"URL {code(url)} does not exist. Ignoring.", style="yellow")
+        print(f"URL {code_str(url)} does not exist. Ignoring.", style="yellow")
 
 
 @remove_app.command("default")
@@ -240,24 +401,118 @@ def remove_default(key: str, conf_path: Optional[str] = None):
     conf_path = get_conf_path(conf_path)
     if not conf_path.exists():
         raise typer.BadParameter(f"Config file not found at {str(conf_path)}")
-    conf = load_conf(conf_path)
-    if key in conf:
-        value = conf.pop(key)
-        write_conf(conf_path, conf)
+    value = None
+
+    def update(conf: dict) -> bool:
+        nonlocal value
+        value = conf.get(key)
+        return _apply_remove_default(conf, key)
+
+    if update_conf(conf_path, update):
         print(
-            f"🎉 Default {code(str(key)+'='+str(value))} removed from {code(conf_path)}",
+            f"🎉 Default {code_str(str(key)+'='+str(value))} removed from "
+            + code_path(conf_path),
             style="green",
         )
     else:
-        print(f"Default {code(key)} does not exist. Ignoring.")
+        print(f"Default {code_str(key)} does not exist. Ignoring.")
+
+
+@app.command()
+def batch(
+    operations: typer.FileText = typer.Argument(
+        "-", help="File to read operations from. Defaults to stdin."
+    ),
+    conf_path: Optional[str] = None,
+):
+    """
+    Applies several add/remove operations, one per line, and writes the config file
+    once. Lines are written like the corresponding commands without the `py-ntfy`
+    prefix, e.g. `add topic my-topic`, `remove email you@foo.bar` or
+    `add default priority 3`. Empty lines and lines starting with # are ignored.
+    If --conf-path is not given, the current working directory will be used.
+    """
+    conf_path = get_conf_path(conf_path)
+    if not conf_path.exists():
+        raise typer.BadParameter(f"Config file not found at {str(conf_path)}")
+
+    # parse everything first so that an invalid line leaves the config untouched
+    ops = []
+    for n, line in enumerate(operations, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        words = line.split(None, 2)
+        if (
+            len(words) < 3
+            or words[0] not in {"add", "remove"}
+            or words[1] not in {*BATCH_TARGETS, "default"}
+        ):
+            raise typer.BadParameter(f"Invalid operation line {n}: '{line}'")
+        action, target, value = words
+        if target != "default":
+            apply = _apply_add if action == "add" else _apply_remove
+            ops.append((line, apply, (BATCH_TARGETS[target], value)))
+        elif action == "add":
+            key, _, value = value.partition(" ")
+            if key not in KEYS["notify_defaults"]:
+                raise typer.BadParameter(
+                    f"key must be one of {sorted(KEYS['notify_defaults'])}, not '{key}'"
+                    + f" (line {n})"
+                )
+            value = value.strip()
+            if not value:
+                raise typer.BadParameter(f"Missing value for '{key}' (line {n})")
+            ops.append((line, _apply_add_default, (key, value)))
+        else:
+            ops.append((line, _apply_remove_default, (value,)))
+
+    # only the target lists the operations modify are indexed and rewritten
+    keys = {args[0] for _, apply, args in ops if apply in (_apply_add, _apply_remove)}
+    applied = 0
+
+    def update(conf: dict) -> bool:
+        nonlocal applied
+        _index_targets(conf, keys)
+        for line, apply, args in ops:
+            if apply(conf, *args):
+                applied += 1
+            else:
+                print(f"Nothing to do for {code_str(line)}. Ignoring.", style="yellow")
+        _unindex_targets(conf, keys)
+        return applied > 0
+
+    update_conf(conf_path, update)
+    print(f"🎉 {applied} operation(s) applied to {code_path(conf_path)}", style="green")
+
+
+def _split_commas(values: Optional[List[str]]) -> List[str]:
+    """
+    Typer callback flattening repeated options whose values may also be
+    comma-separated lists: ``-t a -t b,c`` -> ``["a", "b", "c"]``.
+
+    Args:
+        values (Optional[List[str]]): The option's values.
+
+    Returns:
+        List[str]: The flattened values, empty if there are none. Typer iterates
+            over the callback's result so it must not be ``None``.
+    """
+    if not values:
+        return []
+    return [v.strip() for value in values for v in value.split(",") if v.strip()]
 
 
 @app.command()
 def send(
     message: str,
     conf_path: Optional[str] = None,
-    emails: Optional[str] = None,
-    topics: Optional[str] = None,
+    emails: Optional[List[str]] = typer.Option(
+        None, "--emails", "--email", "-e", callback=_split_commas
+    ),
+    topics: Optional[List[str]] = typer.Option(
+        None, "--topics", "--topic", "-t", callback=_split_commas
+    ),
     title: Optional[str] = None,
     priority: Optional[int] = None,
     tags: Optional[str] = None,
@@ -277,10 +532,12 @@ def send(
         message (str): The message to send
         conf_path (Optional[str], optional): Where to load the configuration from.
             Defaults to ``None`` which means ``$CWD/.ntfy.conf``.
-        emails (Optional[str], optional): Single email or comma-separated list of
-            emails to dispatch the notification to. Defaults to ``None``.
-        topics (Optional[str], optional): Single topic or comma-separated list of
-            topics to dispatch the notification to. Defaults to ``None``.
+        emails (Optional[List[str]], optional): Emails to dispatch the notification
+            to. The option can be repeated and/or hold a comma-separated list of
+            emails. Defaults to ``None``.
+        topics (Optional[List[str]], optional): Topics to dispatch the notification
+            to. The option can be repeated and/or hold a comma-separated list of
+            topics. Defaults to ``None``.
         title (Optional[str], optional): The notification's title. Defaults to ``None``.
         priority (Optional[int], optional): The notification's priority. Defaults to
             ``None``.
@@ -293,9 +550,13 @@ def send(
             https://ntfy.sh/docs/publish/#using-a-header. Defaults to ``None``.
         icon (Optional[str], optional): _description_. Defaults to ``None``.
     """
+    # only ``send`` needs the Notifier (and ``requests``): keep other commands light
+    from ntfy_wrapper import Notifier
+
     dispatchs = Notifier(
-        topics=topics,
-        emails=emails,
+        # no option: fall back to the configuration's targets
+        topics=topics or None,
+        emails=emails or None,
         notify_defaults={},
         conf_path=conf_path,
         write=False,
@@ -311,10 +572,9 @@ def send(
         actions=actions,
         icon=icon,
     )
-    print(
-        "🎉 Notification sent to " + ", ".join([code(d) for d in dispatchs]),
-        style="green",
-    )
+    if dispatchs:
+        targets = ", ".join(code_str(d) for d in dispatchs)
+        print(f"🎉 Notification sent to {targets}", style="green")
 
 
 @app.command()
@@ -324,28 +584,20 @@ def new_topic(save: Optional[bool] = False):
     you use the --save option.
     """
     topic = generate_topic()
-    if save:
-        conf_path = get_conf_path()
-        conf = load_conf(conf_path)
-        topics = conf.get("topics", [])
-        if topic not in topics:
-            topics.append(topic)
-            conf["topics"] = topics
-            if not conf_path.exists():
-                confirm = typer.confirm(
-                    "Config file not found. Do you want to create it?"
-                )
-                if confirm:
-                    write_conf(conf_path, conf)
-                    print(
-                        f"🎉 Topic {code(topic)} added to {code(conf_path)}",
-                        style="green",
-                    )
-                else:
-                    print(f"Attempted topic: {code(topic)}", style="yellow")
-                    typer.Abort()
+    if not save:
+        print(f"🎉 Topic: {code_str(topic)}", style="green")
+        return
+
+    conf_path = get_conf_path()
+    if conf_path.exists():
+        _update_targets(conf_path, _apply_add, "topics", topic)
     else:
-        print(f"🎉 Topic: {code(topic)}", style="green")
+        confirm = typer.confirm("Config file not found. Do you want to create it?")
+        if not confirm:
+            print(f"Attempted topic: {code_str(topic)}", style="yellow")
+            raise typer.Abort()
+        write_conf(conf_path, {**default_conf(), "topics": [topic]})
+    print(f"🎉 Topic {code_str(topic)} added to {code_path(conf_path)}", style="green")
 
 
 @app.command()
@@ -355,22 +607,96 @@ def describe(conf_path: Optional[str] = None):
     if not conf_path.exists():
         raise typer.BadParameter(f"Config file not found at {str(conf_path)}")
     conf = load_conf(conf_path)
-    defaults = code(
-        "\n     • ".join(
-            [""]
-            + [
-                str(k) + " = " + str(v)
-                for k, v in conf.items()
-                if k not in ["topics", "emails", "base_url"]
-            ]
-        )
+    defaults = "".join(
+        [
+            f"\n     • {k} = {v}"
+            for k, v in conf.items()
+            if k not in KEYS["notifier_init"]
+        ]
     )
-    print(f"🎉 Configuration file: {code(conf_path)}", style="green")
-    print(f"   Topics: {code(', '.join(conf.get('topics', [])))}", style="green")
-    print(f"   Emails: {code(', '.join(conf.get('emails', [])))}", style="green")
-    print(f"   Base URLs: {code(', '.join(conf.get('base_url', [])))}", style="green")
-    print(f"   Defaults:{defaults}", style="green")
+    lines = [
+        f"🎉 Configuration file: {code_path(conf_path)}",
+        f"   Topics: {code_str(', '.join(conf.get('topics', [])))}",
+        f"   Emails: {code_str(', '.join(conf.get('emails', [])))}",
+        f"   Base URLs: {code_str(', '.join(conf.get('base_url', [])))}",
+        f"   Defaults:{code_str(defaults)}",
+    ]
+    print("\n".join(lines), style="green")
+
+
+def _command_name(command: typer.models.CommandInfo) -> str:
+    """
+    The name Typer exposes a command under: its explicit name or its function's
+    name with underscores turned into dashes.
+
+    Args:
+        command (typer.models.CommandInfo): A registered Typer command.
+
+    Returns:
+        str: The command's name on the command-line.
+    """
+    return command.name or command.callback.__name__.lower().replace("_", "-")
+
+
+def _prune_commands(typer_app: typer.Typer, name: str) -> typer.Typer:
+    """
+    Returns a shallow copy of ``typer_app`` holding only the command ``name``,
+    or ``typer_app`` itself if there is no such command.
+
+    Args:
+        typer_app (typer.Typer): The app whose commands should be pruned.
+        name (str): The command to keep.
+
+    Returns:
+        typer.Typer: The pruned app.
+    """
+    commands = [c for c in typer_app.registered_commands if _command_name(c) == name]
+    if not commands:
+        return typer_app
+    pruned = copy.copy(typer_app)
+    pruned.registered_commands = commands
+    pruned.registered_groups = []
+    return pruned
+
+
+def build_app(argv: List[str]) -> typer.Typer:
+    """
+    Builds the ``py-ntfy`` app restricted to the (sub-)command invoked in ``argv``
+    so that Typer does not turn every single command into a Click command when
+    only one of them is going to run.
+
+    The full ``app`` is returned for ``--help``, completion or unknown commands.
+
+    Args:
+        argv (List[str]): The command-line arguments, typically ``sys.argv``.
+
+    Returns:
+        typer.Typer: The app to run.
+    """
+    name = argv[1] if len(argv) > 1 else ""
+    pruned = _prune_commands(app, name)
+    if pruned is not app:
+        return pruned
+
+    for group in app.registered_groups:
+        if group.name == name:
+            sub_name = argv[2] if len(argv) > 2 else ""
+            group = copy.copy(group)
+            group.typer_instance = _prune_commands(group.typer_instance, sub_name)
+            pruned = copy.copy(app)
+            pruned.registered_commands = []
+            pruned.registered_groups = [group]
+            return pruned
+
+    return app
+
+
+def main():
+    """
+    Entry point of the ``py-ntfy`` command.
+    """
+    build_app(sys.argv)()
 
 
 if __name__ == "__main__":
-    app()
+    main()
@@ -1,22 +1,42 @@
 """
 Main class for ntfy-wrapper.
 """
+import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Any
-
-import requests
+from typing import Dict, List, Optional, Tuple, Union, Any
 
 from ntfy_wrapper.utils import (
     generate_topic,
     get_conf_path,
     load_conf,
     write_conf,
-    code,
+    code_path,
+    code_str,
     print,
     KEYS,
+    NtfyConf,
 )
 import json
 
+# Local attachments larger than this are streamed from disk for each target
+# instead of being read once and held in memory
+_MAX_BUFFERED_ATTACHMENT = 8 * 1024 * 1024
+
+
+def _dump_headers(headers: Dict[str, Any]) -> str:
+    """
+    Formats headers for ``debug`` outputs.
+
+    Args:
+        headers (Dict[str, Any]): The headers to format.
+
+    Returns:
+        str: Indented JSON dump of the headers.
+    """
+    return "\n    ".join(json.dumps(headers, indent=2).splitlines())
+
 
 class Notifier:
     """
@@ -29,7 +49,7 @@ class Notifier:
         topics: Optional[Union[str, List[str]]] = None,
         emails: Optional[Union[str, List[str]]] = None,
         base_url: Optional[Union[str, List[str]]] = None,
-        notify_defaults: Optional[Dict] = {},
+        notify_defaults: Optional[Dict] = None,
         conf_path: Optional[Union[str, Path]] = None,
         write: Optional[bool] = True,
         warnings: Optional[bool] = True,
@@ -64,15 +84,15 @@ class Notifier:
                 strings describing the emails to send notifications to by default.
                 Be aware of the rate limits: https://ntfy.sh/docs/publish/#limitations
                 Defaults to ``None``.
-            base_url (Optional[str], optional): String or list of strings describing
-                the base url to use and send notifications to. It defaults to ``None``,
-                *i.e.* ``https://ntfy.sh`` but you can set it to a self-hosted ``ntfy``
-                instance for example. ``base_url`` can be a list of comma-separated
-                urls, in which case they will all be notified.
+            base_url (Optional[Union[str, List[str]]], optional): String or list of
+                strings describing the base url to use and send notifications to. It
+                defaults to ``None``, *i.e.* ``https://ntfy.sh`` but you can set it to a
+                self-hosted ``ntfy`` instance for example. ``base_url`` can be a list of
+                comma-separated urls, in which case they will all be notified.
             notify_defaults (Optional[Dict], optional): Dict whose keys and values will
                 be default keyword arguments for the ``Notifier.notify()`` method so
                 that you don't have to write the same stuff again and again throughout
-                your code. Defaults to ``{}``.
+                your code. Defaults to ``None``, *i.e.* no defaults.
             conf_path (Optional[Union[str, Path]], optional): String or ``pathlib.Path``
                 pointing to where the Notifier should get or create its INI
                 configuration file. Defaults to ``None``, meaning ``$CWD/.ntfy.conf``.
@@ -89,11 +109,19 @@ class Notifier:
 
         if isinstance(topics, str):
             topics = [topics]
+        if isinstance(emails, str):
+            # as in notify(): "" means no emails
+            emails = [emails] if emails else []
+        if isinstance(base_url, str):
+            # write_conf() expects a list, as load_conf() returns
+            base_url = [u.strip() for u in base_url.split(",")]
+        if notify_defaults is None:
+            notify_defaults = {}
 
         assert isinstance(notify_defaults, dict), "notify_defaults must be a dict"
-        assert all(
-            k in KEYS["notify_defaults"] for k in notify_defaults.keys()
-        ), "notify_defaults keys must be in " + str(KEYS["notify_defaults"])
+        assert KEYS["notify_defaults"].issuperset(
+            notify_defaults
+        ), "notify_defaults keys must be in " + str(sorted(KEYS["notify_defaults"]))
 
         # cwd/.ntfy.conf if conf_path is None
         self.conf_path = get_conf_path(conf_path)
@@ -101,16 +129,16 @@ class Notifier:
         # read ini config if it exists
         # otherwise, gets initialized with default values
         # that can be overwritten by the user in the conf or the init args
-        conf = load_conf(self.conf_path)
-        conf.update(notify_defaults)
-        if topics is not None:
-            conf["topics"] = topics
-        if emails is not None:
-            conf["emails"] = emails
-        if base_url is not None:
-            conf["base_url"] = base_url
-
-        self.conf = conf
+        targets = {"topics": topics, "emails": emails, "base_url": base_url}
+        self.conf: NtfyConf = {
+            **load_conf(self.conf_path),
+            **notify_defaults,
+            **{k: v for k, v in targets.items() if v is not None},
+        }
+        # requests.Session created on the first notification, see _get_session()
+        self._session = None
+        # derived from self.conf on the first notification, see _reset_defaults()
+        self._reset_defaults()
 
         if not self.conf.get("topics"):
             if not self.conf.get("emails"):
@@ -136,6 +164,31 @@ class Notifier:
         """
         return self.notify(*args, **kwds)
 
+    def __enter__(self) -> "Notifier":
+        """
+        Use the Notifier as a context manager: ``with Notifier() as notifier: ...``
+
+        Returns:
+            Notifier: ``self``
+        """
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """
+        Closes the Notifier's connections when leaving the ``with`` block, see
+        ``Notifier.close()``.
+        """
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes the connections kept alive to the ntfy server(s). The Notifier can
+        still be used afterwards: a new session is created on the next notification.
+        """
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
     def _warn(self, message: str) -> None:
         """
         Print a warning message if warnings are enabled.
@@ -146,36 +199,321 @@ class Notifier:
         if self.warnings:
             print(message, style="yellow")
 
+    def _get_session(self):
+        """
+        Creates the ``requests.Session`` used to send notifications on first use.
+        Re-using a session keeps connections to the ntfy server alive across
+        notifications and targets instead of paying a new TCP+TLS handshake for
+        each of them.
+
+        Returns:
+            requests.Session: The Notifier's HTTP session.
+        """
+        if self._session is None:
+            # imported here so that importing ntfy_wrapper does not load requests
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            self._session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+            self._session.mount("http://", adapter)
+            self._session.mount("https://", adapter)
+        return self._session
+
+    def _reset_defaults(self) -> None:
+        """
+        Drops the headers and base urls derived from ``self.conf``: they are
+        computed again on the next notification. Must be called whenever
+        ``self.conf``'s defaults or base urls change.
+        """
+        self._default_headers = None
+        self._default_base_urls = None
+
+    def _get_default_headers(self) -> Dict[str, str]:
+        """
+        Returns the headers built from the Notifier's notify defaults, computed
+        once and cached until ``self._reset_defaults()`` is called.
+
+        Returns:
+            Dict[str, str]: The default headers. Callers must not mutate them.
+        """
+        if self._default_headers is None:
+            self._default_headers = {
+                # list values (e.g. tags) are sent comma-separated, as in notify()
+                k.capitalize(): (
+                    ",".join(map(str, v)) if isinstance(v, (list, tuple)) else str(v)
+                )
+                for k, v in self.conf.items()
+                if k not in KEYS["notifier_init"] and v is not None
+            }
+        return self._default_headers
+
+    def _get_default_base_urls(self) -> List[str]:
+        """
+        Returns the normalized base urls from the Notifier's configuration,
+        computed once and cached until ``self._reset_defaults()`` is called.
+
+        Returns:
+            List[str]: The default base urls. Callers must not mutate them.
+        """
+        if self._default_base_urls is None:
+            self._default_base_urls = self._normalize_base_urls(
+                self.conf.get("base_url", ["https://ntfy.sh"])
+            )
+        return self._default_base_urls
+
+    def _normalize_base_urls(self, base_url: Union[str, List[str]]) -> List[str]:
+        """
+        Turns a base url, a coma-separated list of base urls or a list of base urls
+        into a list of base urls without trailing ``/``, defaulting to
+        ``https://ntfy.sh``.
+
+        Args:
+            base_url (Union[str, List[str]]): The base url(s) to normalize.
+
+        Returns:
+            List[str]: The normalized base urls.
+        """
+        if isinstance(base_url, str):
+            if "," in base_url:
+                base_urls = [u.strip() for u in base_url.split(",")]
+            else:
+                base_urls = [base_url]
+        else:
+            base_urls = base_url
+        if not isinstance(base_urls, list) or not base_urls or not base_urls[0]:
+            self._warn(
+                "\nNo base URL specified in conf or as argument,"
+                + " using https://ntfy.sh\n"
+            )
+            base_urls = ["https://ntfy.sh"]
+
+        normalized = []
+        for u in base_urls:
+            if not u.startswith("http"):
+                self._warn(f"\nBe careful, base url does not start with `http` : {u}\n")
+            normalized.append(u[:-1] if u.endswith("/") else u)
+        return normalized
+
+    def _build_headers(
+        self,
+        title: Optional[str] = None,
+        priority: Optional[int] = None,
+        tags: Optional[Union[str, List[str]]] = None,
+        click: Optional[str] = None,
+        attach: Optional[str] = None,
+        actions: Optional[Union[str, List[str]]] = None,
+        icon: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Builds the headers shared by all the targets of a notification from
+        ``Notifier.notify()``'s arguments and the Notifier's defaults.
+
+        A local ``attach`` file is not a header: it is the caller's job to send it.
+
+        Returns:
+            Dict[str, Any]: The notification's headers.
+        """
+        headers = dict(self._get_default_headers())
+        if priority is not None:
+            headers["Priority"] = str(priority)
+
+        if title is not None:
+            headers["Title"] = title
+
+        if click is not None:
+            headers["Click"] = click
+        if icon is not None:
+            headers["Icon"] = icon
+
+        if tags is not None:
+            if isinstance(tags, str):
+                tags = [tags]
+            headers["Tags"] = ",".join(tags)
+
+        if attach is not None and attach.startswith("http"):
+            headers["Attach"] = attach
+
+        if actions is not None:
+            if isinstance(actions, str):
+                actions = [actions]
+            headers["Actions"] = ",".join(actions)
+
+        return headers
+
+    def _resolve_targets(
+        self,
+        topics: Optional[Union[str, List[str]]] = None,
+        emails: Optional[Union[str, List[str]]] = None,
+        base_url: Optional[Union[str, List[str]]] = None,
+    ) -> List[Tuple[str, str, str]]:
+        """
+        Resolves ``Notifier.notify()``'s targets arguments against the Notifier's
+        configuration.
+
+        Returns:
+            List[Tuple[str, str, str]]: ``(base_url, "topic" | "email", dest)``
+                tuples: one for each topic and each email, for each base url.
+        """
+        if base_url is None:
+            base_urls = self._get_default_base_urls()
+        else:
+            base_urls = self._normalize_base_urls(base_url)
+
+        if emails is not None:
+            if isinstance(emails, str):
+                emails = [emails] if emails else []
+        else:
+            emails = self.conf.get("emails", [])
+
+        if topics is not None:
+            if isinstance(topics, str):
+                topics = [topics]
+        else:
+            topics = self.conf.get("topics", [])
+
+        assert isinstance(emails, list)
+        assert isinstance(topics, list)
+        assert isinstance(base_urls, list)
+
+        # built once, not once per base url
+        dests = list(
+            chain((("topic", t) for t in topics), (("email", e) for e in emails))
+        )
+        return [(u, dtype, dest) for u in base_urls for dtype, dest in dests]
+
+    def _dispatch(
+        self,
+        targets: List[Tuple[str, str, str]],
+        bodies: List[Union[bytes, Path]],
+        headers: Dict[str, Any],
+        use_PUT: bool = False,
+        debug: Optional[bool] = False,
+    ) -> List[str]:
+        """
+        Sends ``bodies``, in order, to each of the ``targets``. Targets are
+        notified concurrently unless ``debug`` is True.
+
+        Args:
+            targets (List[Tuple[str, str, str]]): Targets, as returned by
+                ``Notifier._resolve_targets()``.
+            bodies (List[Union[bytes, Path]]): The requests' bodies. A ``Path`` is
+                opened and streamed by each target instead of being held in memory.
+            headers (Dict[str, Any]): The headers shared by all the targets.
+            use_PUT (bool, optional): Whether to ``PUT`` an attachment instead of
+                ``POST``-ing a message. Defaults to ``False``.
+            debug (Optional[bool], optional): Whether to print debug information or
+                not. Defaults to ``False``.
+
+        Returns:
+            List[str]: The destinations notifications have been dispatched to.
+        """
+        session = self._get_session()
+        send = session.put if use_PUT else session.post
+        # topics share ``headers``: only dump them once
+        dumped_headers = _dump_headers(headers) if debug else None
+
+        def dispatch(target: Tuple[str, str, str]) -> str:
+            base_url, dtype, dest = target
+
+            if dtype == "email":
+                h = {**headers, "Email": dest}
+                url = f"{base_url}/alerts"
+            else:
+                # requests does not mutate ``headers``: share them across topics
+                h = headers
+                url = f"{base_url}/{dest}"
+
+            for body in bodies:
+                if debug and not use_PUT:
+                    dumped = dumped_headers if h is headers else _dump_headers(h)
+                    print(
+                        f"➡️ Sending `{body.decode('utf-8')}` to `{dest}`:"
+                        + f"\n    target url:  {url}"
+                        + f"\n    message:  {body}"
+                        + f"\n    headers:  {dumped}"
+                    )
+                if isinstance(body, Path):
+                    # requests sets Content-Length from the file's size
+                    with body.open("rb") as f:
+                        send(url, data=f, headers=h)
+                else:
+                    send(url, data=body, headers=h)
+            return dest
+
+        if debug or len(targets) < 2:
+            # sequential: debug prints must not interleave
+            dispatchs = [dispatch(t) for t in targets]
+        else:
+            # requests release the GIL while waiting for the server: send them
+            # concurrently so the total latency is ~the slowest one, not their sum
+            with ThreadPoolExecutor(max_workers=min(8, len(targets))) as executor:
+                dispatchs = list(executor.map(dispatch, targets))
+
+        if debug:
+            print(
+                "\nDebug mode: make sure the above messages,"
+                + " headers and targets are correct."
+            )
+            print(
+                "In particular, no `None` should appear in the headers, and all their"
+                + " keys should start with an uppercase letter."
+            )
+            print(
+                "Refer to the `ntfy` documentation for more details about the exact "
+                + "syntax for individual headers: https://ntfy.sh/docs/publish/"
+            )
+
+        return dispatchs
+
     def describe(self):
         """
         Describe the notifier.
         """
         if self.conf.get("topics"):
             print(
-                f"📬 {code('Notifier')} will push to topics: "
-                + ", ".join([code(t) for t in self.conf["topics"]])
+                f"📬 {code_str('Notifier')} will push to topics: "
+                + ", ".join([code_str(t) for t in self.conf["topics"]])
             )
         if self.conf.get("emails"):
             print(
                 "📧 Notifier will send emails to: "
-                + ", ".join([code(e) for e in self.conf["emails"]])
+                + ", ".join([code_str(e) for e in self.conf["emails"]])
             )
         if self.conf.get("base_url"):
             print(
                 "🏡 Notifier will push to base url: "
-                + ", ".join([code(e) for e in self.conf["base_url"]])
+                + ", ".join([code_str(e) for e in self.conf["base_url"]])
             )
-        keys = [
-            k for k in self.conf.keys() if k not in ["topics", "emails", "base_url"]
-        ]
+        keys = [k for k in self.conf.keys() if k not in KEYS["notifier_init"]]
         if keys:
             ml = max([len(k) for k in keys])
-            print(f"🛠  {code('Notifier.notify(..)')} defaults:")
+            print(f"🛠  {code_str('Notifier.notify(..)')} defaults:")
             for k in keys:
-                print(f"  • {code(k):{ml+13}} -> {code(self.conf[k])}")
-        print("🗃  Its configuration is in: " + code(self.conf_path))
+                print(f"  • {code_str(k):{ml+13}} -> {code_str(self.conf[k])}")
+        print("🗃  Its configuration is in: " + code_path(self.conf_path))
         return ""
 
+    def _remove_targets(self, key: str, values: List[str], warning: str) -> None:
+        """
+        Removes ``values`` from the ``self.conf[key]`` list, keeping the order of the
+        remaining ones, and warns about the values that were not in it.
+
+        Args:
+            key (str): The configuration key: ``topics``, ``emails`` or ``base_url``.
+            values (List[str]): The values to remove.
+            warning (str): Warning template for missing values, formatted with the
+                missing value.
+        """
+        current = self.conf.get(key, [])
+        # set membership: O(n + k) instead of O(n * k) list scans and removals
+        current_set = set(current)
+        for v in values:
+            if v not in current_set:
+                self._warn(warning.format(v))
+        to_remove = set(values)
+        self.conf[key] = [v for v in current if v not in to_remove]
+
     def remove_topics(
         self,
         topics: List[str],
@@ -191,11 +529,7 @@ class Notifier:
             write (Optional[bool], optional): Whether to update the config file or not.
                 Defaults to ``True``.
         """
-        for t in topics:
-            if t not in self.conf.get("topics", []):
-                self._warn(f"Topic {t} is not in the list of topics")
-            else:
-                self.conf["topics"].remove(t)
+        self._remove_targets("topics", topics, "Topic {} is not in the list of topics")
         if write:
             self.write_to_conf()
 
@@ -214,11 +548,7 @@ class Notifier:
             write (Optional[bool], optional): Whether to update the config file or not.
                 Defaults to ``True``.
         """
-        for e in emails:
-            if e not in self.conf.get("emails", []):
-                self._warn(f"Email {e} is not in the list of emails")
-            else:
-                self.conf["emails"].remove(e)
+        self._remove_targets("emails", emails, "Email {} is not in the list of emails")
         if write:
             self.write_to_conf()
 
@@ -237,11 +567,10 @@ class Notifier:
             write (Optional[bool], optional): Whether to update the config file or not.
                 Defaults to ``True``.
         """
-        for e in base_urls:
-            if e not in self.conf.get("base_url", []):
-                self._warn(f"URL {e} is not in the list of base_url")
-            else:
-                self.conf["base_url"].remove(e)
+        self._remove_targets(
+            "base_url", base_urls, "URL {} is not in the list of base_url"
+        )
+        self._reset_defaults()
         if write:
             self.write_to_conf()
 
@@ -281,6 +610,7 @@ class Notifier:
                 Defaults to ``True``.
         """
         self.conf["base_url"] = []
+        self._reset_defaults()
         if write:
             self.write_to_conf()
 
@@ -291,8 +621,8 @@ class Notifier:
         self._warn(
             "❗️ Warning: your configuration may contain sensitive data. "
             + "Make sure it is ignored by your version control system "
-            + f"(in {code('.gitignore')} for instance)."
-            + f" Use {code('warnings=False')} in {code('Notifier.__init__')}"
+            + f"(in {code_str('.gitignore')} for instance)."
+            + f" Use {code_str('warnings=False')} in {code_str('Notifier.__init__')}"
             + " to disable this warning."
         )
         write_conf(self.conf_path, self.conf)
@@ -308,10 +638,11 @@ class Notifier:
             notify_defaults (Dict[str, Any]): The notify defaults to add.
         """
         assert isinstance(notify_defaults, dict), "notify_defaults must be a dict"
-        assert all(
-            k in KEYS["notify_defaults"] for k in notify_defaults.keys()
-        ), "notify_defaults keys must be in " + str(KEYS["notify_defaults"])
+        assert KEYS["notify_defaults"].issuperset(
+            notify_defaults
+        ), "notify_defaults keys must be in " + str(sorted(KEYS["notify_defaults"]))
         self.conf.update(notify_defaults)
+        self._reset_defaults()
         if write:
             self.write_to_conf()
 
@@ -324,12 +655,13 @@ class Notifier:
             notify_defaults (List[str]): The notify defaults to remove.
         """
         assert isinstance(notify_defaults, list), "notify_defaults must be a list"
-        assert all(
-            k in KEYS["notify_defaults"] for k in notify_defaults
-        ), "notify_defaults keys must be in " + str(KEYS["notify_defaults"])
+        assert KEYS["notify_defaults"].issuperset(
+            notify_defaults
+        ), "notify_defaults keys must be in " + str(sorted(KEYS["notify_defaults"]))
         for k in notify_defaults:
             if k in self.conf:
                 del self.conf[k]
+        self._reset_defaults()
         if write:
             self.write_to_conf()
 
@@ -406,128 +738,74 @@ class Notifier:
             List[str]: A list of the targets notifications have been dispatched to:
                 one for each topic and one for each email.
         """
-        defaults = {
-            k.capitalize(): v
-            for k, v in self.conf.items()
-            if k not in {"topics", "emails", "base_url"}
-        }
-        headers = {**defaults, "priority": priority}
-        headers = {k: v for k, v in headers.items() if v is not None}
-
         if attach and message:
             raise ValueError("You cannot specify both `attach` and `message`")
 
-        use_PUT = False
-
-        if base_url is None:
-            base_url = self.conf.get("base_url", ["https://ntfy.sh"])
-        if isinstance(base_url, str):
-            if "," in base_url:
-                base_urls = [u.strip() for u in base_url.split(",")]
-            else:
-                base_urls = [base_url]
-        if not isinstance(base_urls, list) or not base_urls or not base_urls[0]:
-            self._warn(
-                "\nNo base URL specified in conf or as argument,"
-                + " using https://ntfy.sh\n"
-            )
-            base_urls = ["https://ntfy.sh"]
-
-        for u in base_urls:
-            if not u.startswith("http"):
-                self._warn(f"\nBe careful, base url does not start with `http` : {u}\n")
-
-        base_urls = [u[:-1] if u.endswith("/") else u for u in base_urls]
-
-        if title is not None:
-            headers["Title"] = title
-
-        if click is not None:
-            headers["Click"] = click
-        if icon is not None:
-            headers["Icon"] = icon
-
-        if tags is not None:
-            if isinstance(tags, str):
-                tags = [tags]
-            headers["Tags"] = ",".join(tags)
-
-        if attach is not None:
-            if not attach.startswith("http"):
-                use_PUT = True
+        headers = self._build_headers(
+            title=title,
+            priority=priority,
+            tags=tags,
+            click=click,
+            attach=attach,
+            actions=actions,
+            icon=icon,
+        )
+        use_PUT = attach is not None and not attach.startswith("http")
+        if use_PUT:
+            headers["Filename"] = os.path.basename(attach)
+            if os.path.getsize(attach) > _MAX_BUFFERED_ATTACHMENT:
+                # streamed from disk by each target, see _dispatch()
+                body = Path(attach)
             else:
-                headers["Attach"] = attach
-
-        if actions is not None:
-            if isinstance(actions, str):
-                actions = [actions]
-            headers["Actions"] = ",".join(actions)
-
-        if emails is not None:
-            if isinstance(emails, str):
-                emails = [emails]
+                with open(attach, "rb") as f:
+                    body = f.read()
         else:
-            emails = self.conf.get("emails", [])
+            body = message.encode("utf-8")
 
-        if topics is not None:
-            if isinstance(topics, str):
-                topics = [topics]
-        else:
-            topics = self.conf.get("topics", [])
+        targets = self._resolve_targets(topics, emails, base_url)
+        return self._dispatch(targets, [body], headers, use_PUT, debug)
 
-        assert isinstance(emails, list)
-        assert isinstance(topics, list)
-        assert isinstance(base_urls, list)
+    def notify_many(
+        self,
+        messages: List[str],
+        topics: Optional[Union[str, List[str]]] = None,
+        emails: Optional[Union[str, List[str]]] = None,
+        base_url: Optional[Union[str, List[str]]] = None,
+        title: Optional[str] = None,
+        priority: Optional[int] = None,
+        tags: Optional[Union[str, List[str]]] = None,
+        click: Optional[str] = None,
+        actions: Optional[Union[str, List[str]]] = None,
+        icon: Optional[str] = None,
+        debug: Optional[bool] = False,
+    ) -> List[str]:
+        """
+        Send several messages to the same targets, with the same options.
 
-        dispatchs = []
-        for base_url in base_urls:
-            for dtype, dest in [("topic", t) for t in topics] + [
-                ("email", e) for e in emails
-            ]:
-                h = headers.copy()
+        Headers and targets are resolved once for all messages instead of once per
+        ``notify()`` call. Targets are notified concurrently, but each target
+        receives the messages in order.
 
-                if dtype == "email":
-                    h["Email"] = dest
-                    url = f"{base_url}/alerts"
-                else:
-                    url = f"{base_url}/{dest}"
-
-                dispatchs.append(dest)
-
-                if not use_PUT:
-                    if debug:
-                        print(f"➡️ Sending `{message}` to `{dest}`:")
-                        print("    target url: ", url)
-                        print("    message: ", message.encode("utf-8"))
-                        print(
-                            "    headers: ",
-                            "\n    ".join(json.dumps(h, indent=2).splitlines()),
-                        )
-                    requests.post(
-                        url,
-                        data=message.encode("utf-8"),
-                        headers=h,
-                    )
-                else:
-                    h["Filename"] = Path(attach).name
-                    requests.put(
-                        url,
-                        data=open(attach, "rb"),
-                        headers=h,
-                    )
+        All arguments but ``messages`` are the same as ``Notifier.notify()``'s and
+        are shared by all messages: per-message options are not supported, nor
+        are attachments.
 
-        if debug:
-            print(
-                "\nDebug mode: make sure the above messages,"
-                + " headers and targets are correct."
-            )
-            print(
-                "In particular, no `None` should appear in the headers, and all their"
-                + " keys should start with an uppercase letter."
-            )
-            print(
-                "Refer to the `ntfy` documentation for more details about the exact "
-                + "syntax for individual headers: https://ntfy.sh/docs/publish/"
-            )
+        Args:
+            messages (List[str]): The messages to send.
 
-        return dispatchs
+        Returns:
+            List[str]: A list of the targets notifications have been dispatched to:
+                one for each topic and one for each email, each of which received
+                all ``messages``.
+        """
+        headers = self._build_headers(
+            title=title,
+            priority=priority,
+            tags=tags,
+            click=click,
+            actions=actions,
+            icon=icon,
+        )
+        bodies = [m.encode("utf-8") for m in messages]
+        targets = self._resolve_targets(topics, emails, base_url)
+        return self._dispatch(targets, bodies, headers, False, debug)
@@ -1,34 +1,59 @@
 """
 A module containing utility functions for ntfy-wrapper.
 """
-import configparser
-from copy import deepcopy
-from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+import os
+import secrets
+import shutil
+import tempfile
+from functools import lru_cache
+from pathlib import Path, PurePath
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypedDict, Union
 
-from rich.console import Console
-from rich.theme import Theme
-from xkcdpass import xkcd_password as xp
-
-custom_theme = Theme({"code": "grey70 bold italic"})
-print = Console(theme=custom_theme).print
+_console = None
 KEYS = {
-    "notifier_init": {"topics", "emails"},
-    "notify_defaults": {
-        "message",
-        "topics",
-        "emails",
-        "title",
-        "priority",
-        "tags",
-        "click",
-        "attach",
-        "actions",
-        "icon",
-    },
+    "notifier_init": frozenset({"topics", "emails", "base_url"}),
+    "notify_defaults": frozenset(
+        {
+            "message",
+            "topics",
+            "emails",
+            "title",
+            "priority",
+            "tags",
+            "click",
+            "attach",
+            "actions",
+            "icon",
+        }
+    ),
 }
 
 
+class NtfyConf(TypedDict, total=False):
+    """
+    A configuration. ``load_conf`` returns the ``[notifier_init]`` targets as lists
+    and the ``[notify_defaults]`` as strings, but a ``Notifier`` also stores the
+    values it was given, e.g. an ``int`` priority or a list of tags.
+    """
+
+    topics: List[str]
+    emails: List[str]
+    base_url: List[str]
+    message: str
+    title: str
+    priority: Union[str, int]
+    tags: Union[str, List[str]]
+    click: str
+    attach: str
+    actions: Union[str, List[str]]
+    icon: str
+
+
+# Parsed configuration files: {absolute path: ((mtime_ns, size), conf)}
+_CONF_CACHE: Dict[str, Tuple[Tuple[int, int], NtfyConf]] = {}
+_CONF_CACHE_SIZE = 32
+
+
 DOCSTRING = """
 This INI config file contains 2 sections:
 [notifier_init], and [notify_defaults].
@@ -60,6 +85,35 @@ icon = https://raw.githubusercontent.com/vict0rsch/ntfy-wrapper/main/assets/logo
 ----------------------------------------------------------------------------------------
 """
 
+# [about] section of the configuration files: DOCSTRING as comments.
+# splitlines() does not yield the trailing empty line split("\n") would
+_ABOUT_LINES = tuple(("# " + line).strip() for line in DOCSTRING.splitlines()[1:])
+
+
+def _get_console():
+    """
+    Creates the ``rich`` Console shared by ntfy-wrapper the first time it is needed,
+    so that importing ntfy-wrapper (or running ``py-ntfy --help``) does not pay
+    for it.
+
+    Returns:
+        rich.console.Console: The shared console.
+    """
+    global _console
+    if _console is None:
+        from rich.console import Console
+        from rich.theme import Theme
+
+        _console = Console(theme=Theme({"code": "grey70 bold italic"}))
+    return _console
+
+
+def print(*args: Any, **kwargs: Any) -> None:
+    """
+    ``rich``'s ``Console.print`` with ntfy-wrapper's theme.
+    """
+    _get_console().print(*args, **kwargs)
+
 
 def get_conf_path(conf_path: Optional[Union[str, Path]] = None) -> Path:
     """
@@ -73,113 +127,321 @@ def get_conf_path(conf_path: Optional[Union[str, Path]] = None) -> Path:
             file. Defaults to ``None``.
 
     Returns:
-        Path: _description_
+        Path: The path to the configuration file.
     """
+    # resolved on strings, the Path is only built once for the result
     if conf_path is None:
-        path = Path.cwd()
-    elif isinstance(conf_path, str):
-        path = Path(conf_path)
-    else:
-        path = conf_path
+        # the working directory is a directory: no need to ask the filesystem
+        return Path(os.path.join(os.getcwd(), ".ntfy.conf"))
+
+    # "" is the working directory, as for os.path functions
+    conf_path = os.fspath(conf_path) or "."
+    # an explicit ``.ntfy.conf`` is the file itself: skip the isdir() syscall
+    if os.path.basename(conf_path) != ".ntfy.conf" and os.path.isdir(conf_path):
+        conf_path = os.path.join(conf_path, ".ntfy.conf")
 
-    if path.is_dir():
-        path = path / ".ntfy.conf"
+    return Path(conf_path)
 
-    return path
 
+def default_conf() -> NtfyConf:
+    """
+    The configuration used when there is no configuration file.
 
-def load_conf(conf_path: Optional[Union[str, Path]] = None) -> dict:
+    Returns:
+        NtfyConf: Default ``Notifier.notify(..)`` values.
+    """
+    return {
+        "title": "Message from ntfy-wrapper",
+        "tags": "fire",
+        "icon": "https://raw.githubusercontent.com/vict0rsch/ntfy-wrapper/main/assets/logo.png",  # noqa E501
+    }
+
+
+def _parse_ini(text: str) -> Dict[str, Dict[str, str]]:
+    """
+    Minimal INI parser for ntfy-wrapper's configuration files, which only contain
+    ``[section]`` headers, ``key = value`` (or ``key: value``) pairs and full-line
+    ``#``/``;`` comments. Much lighter than ``configparser`` for such files.
+
+    As with ``configparser``, keys are lower-cased and lines indented deeper than
+    their key continue its value. Unlike it, values are never interpolated.
+
+    Args:
+        text (str): The INI file's content.
+
+    Raises:
+        ValueError: If a line comes before the first section header or has no
+            delimiter.
+
+    Returns:
+        Dict[str, Dict[str, str]]: ``{section: {key: value}}``
+    """
+    sections = {}
+    section = values = None
+    indent = 0
+    for n, raw in enumerate(text.splitlines(), 1):
+        line = raw.strip()
+        if not line:
+            # kept inside multi-line values, trailing ones are stripped below
+            if values is not None:
+                values.append("")
+            continue
+        if line[0] in "#;":
+            continue
+        level = len(raw) - len(raw.lstrip())
+        if values is not None and level > indent:
+            values.append(line)
+            continue
+        indent = level
+        if line[0] == "[" and line[-1] == "]":
+            section = sections.setdefault(line[1:-1].strip(), {})
+            values = None
+            continue
+        if section is None:
+            raise ValueError(f"Line {n} is not in a [section]: {raw!r}")
+        eq, colon = line.find("="), line.find(":")
+        # split on the first delimiter, as configparser does
+        i = max(eq, colon) if min(eq, colon) < 0 else min(eq, colon)
+        if i <= 0:
+            raise ValueError(f"Line {n} is not a 'key = value' pair: {raw!r}")
+        values = [line[i + 1 :].strip()]
+        section[line[:i].strip().lower()] = values
+    return {
+        name: {k: "\n".join(v).rstrip() for k, v in section.items()}
+        for name, section in sections.items()
+    }
+
+
+def _copy_conf(conf: NtfyConf) -> NtfyConf:
+    """
+    Copies a configuration so that callers can mutate it freely. Values are
+    strings or lists of strings, so copying the lists is enough and much cheaper
+    than ``deepcopy``.
+
+    Args:
+        conf (dict): The configuration to copy.
+
+    Returns:
+        NtfyConf: The copy.
+    """
+    return {k: list(v) if isinstance(v, list) else v for k, v in conf.items()}
+
+
+def load_conf(conf_path: Optional[Union[str, Path]] = None) -> NtfyConf:
     """
     Loads a config file from the given path.
-    Expects the INI format and will use configparser.
+    Expects the INI format, see ``_parse_ini``.
+
+    Parsed files are cached in-process and only parsed again if their modification
+    time or size changed (or if they were written with ``write_conf``).
 
     Args:
         conf_path (Optional[Union[str, Path]], optional): Where to load the conf
         from. Defaults to ``None``.
 
     Returns:
-        dict: The configuration as a dictionary.
+        NtfyConf: The configuration as a dictionary.
     """
     path = get_conf_path(conf_path)
-    if path.exists():
-        config = configparser.ConfigParser()
-        config.read(path)
-        conf = {}
-        if config.has_section("notifier_init"):
-            if "topics" in config["notifier_init"]:
-                conf["topics"] = [
-                    t.strip() for t in config.get("notifier_init", "topics").split(",")
-                ]
-            if "emails" in config["notifier_init"]:
-                conf["emails"] = [
-                    e.strip() for e in config.get("notifier_init", "emails").split(",")
-                ]
-            if "base_url" in config["notifier_init"]:
-                conf["base_url"] = [
-                    e.strip()
-                    for e in config.get("notifier_init", "base_url").split(",")
-                ]
-        if config.has_section("notify_defaults"):
-            conf.update(dict(config["notify_defaults"]))
-        return conf
-
-    return {
-        "title": "Message from ntfy-wrapper",
-        "tags": "fire",
-        "icon": "https://raw.githubusercontent.com/vict0rsch/ntfy-wrapper/main/assets/logo.png",  # noqa E501
-    }
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return default_conf()
+    # the size catches rewrites within the filesystem's mtime granularity
+    stamp = (st.st_mtime_ns, st.st_size)
+    # absolute key: relative paths from different working directories must not
+    # share an entry, while the same file reached differently should
+    key = os.path.abspath(path)
+    cached = _CONF_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        return _copy_conf(cached[1])
+    # read_bytes skips the text-mode wrapper; splitlines() handles any newlines and
+    # utf-8-sig drops the byte order mark some editors prepend
+    sections = _parse_ini(path.read_bytes().decode("utf-8-sig"))
+    conf = {}
+    init = sections.get("notifier_init", {})
+    for k in ("topics", "emails", "base_url"):
+        if k in init:
+            conf[k] = list(map(str.strip, init[k].split(",")))
+    conf.update(sections.get("notify_defaults", {}))
+    if key not in _CONF_CACHE and len(_CONF_CACHE) >= _CONF_CACHE_SIZE:
+        # evict the oldest entry
+        _CONF_CACHE.pop(next(iter(_CONF_CACHE)))
+    _CONF_CACHE[key] = (stamp, _copy_conf(conf))
+    return conf
 
 
 def write_conf(
     conf_path: Path,
-    conf: Dict[str, Union[str, List[str]]],
+    conf: NtfyConf,
 ) -> None:
     """
     Write the configuration file as an INI file.
     Always prepend the file with comments and example.
 
+    The format is fixed so the text is built directly rather than through
+    ``configparser``. ``None`` values are skipped and others are written as
+    strings. Values cannot span several lines.
+
+    The file is written atomically: the whole content is written at once to a
+    temporary file in the same directory, which then replaces ``conf_path``.
+    Nothing is written if ``conf_path`` already has the exact same content.
+
     Args:
         conf_path (Path): The path to the configuration file.
-        conf (Dict[str, Union[str, List[str]]]): The configuration to write.
-    """
-    conf = deepcopy(conf)
-    topics = conf.pop("topics", None)
-    emails = conf.pop("emails", None)
-    base_url = conf.pop("base_url", None)
-
-    config = configparser.ConfigParser(allow_no_value=True)
+        conf (NtfyConf): The configuration to write.
 
-    config.add_section("about")
-    for line in DOCSTRING.split("\n")[1:]:
-        config.set("about", ("# " + line).strip())
+    Raises:
+        ValueError: If a value contains a line break.
+    """
+    topics = conf.get("topics")
+    emails = conf.get("emails")
+    base_url = conf.get("base_url")
 
-    config.add_section("notifier_init")
+    parts = ["[about]", *_ABOUT_LINES, "", "[notifier_init]"]
     if topics:
-        config.set("notifier_init", "topics", ",".join(topics))
+        parts.append("topics = " + ",".join(topics))
     if emails:
-        config.set("notifier_init", "emails", ",".join(emails))
+        parts.append("emails = " + ",".join(emails))
     if base_url:
-        config.set("notifier_init", "base_url", ",".join(base_url))
+        parts.append("base_url = " + ",".join(base_url))
+    parts += ["", "[notify_defaults]"]
+    parts += [
+        f"{k} = {','.join(map(str, v)) if isinstance(v, (list, tuple)) else v}"
+        for k, v in conf.items()
+        if k not in KEYS["notifier_init"] and v is not None
+    ]
+    for line in parts:
+        # _parse_ini() reads one ``key = value`` per line: a line break would
+        # silently truncate the value
+        if "\n" in line or "\r" in line:
+            raise ValueError(
+                "Configuration values cannot contain line breaks: "
+                + repr(line.partition(" = ")[0])
+            )
+    data = ("\n".join(parts) + "\n\n").encode("utf-8")
+
+    try:
+        # configuration files are tiny: comparing bytes is cheaper than the
+        # temporary file + fsync + rename below
+        if conf_path.read_bytes() == data:
+            return
+    except FileNotFoundError:
+        pass
 
-    config.add_section("notify_defaults")
-    for k, v in conf.items():
-        config.set("notify_defaults", k, v)
+    # write next to the symlink's target so the link itself survives the replace
+    target = os.path.realpath(conf_path)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(target), prefix=os.path.basename(target), suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(target):
+            shutil.copymode(target, tmp_path)
+        os.replace(tmp_path, target)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+    _CONF_CACHE.pop(os.path.abspath(conf_path), None)
 
-    with conf_path.open("w", encoding="utf-8") as f:
-        config.write(f)
+
+def update_conf(conf_path: Path, update: Callable[[NtfyConf], bool]) -> bool:
+    """
+    Reads the configuration file once, updates it in place with ``update`` and writes
+    it once, only if ``update`` reports a change.
+
+    Args:
+        conf_path (Path): The path to the configuration file.
+        update (Callable[[NtfyConf], bool]): Function updating the loaded configuration
+            in place and returning whether it changed.
+
+    Returns:
+        bool: Whether the configuration changed and was written.
+    """
+    conf = load_conf(conf_path)
+    if not update(conf):
+        return False
+    write_conf(conf_path, conf)
+    return True
+
+
+@lru_cache(maxsize=1)
+def _topic_words() -> List[str]:
+    """
+    Loads and filters ``xkcdpass``'s default word list once per process.
+
+    Returns:
+        List[str]: The candidate words for topic ids. Must not be mutated.
+    """
+    from xkcdpass import xkcd_password as xp
+
+    wordfile = xp.locate_wordfile()
+    return xp.generate_wordlist(wordfile=wordfile, min_length=3, max_length=6)
 
 
 def generate_topic():
     """
-    Generate a cryptographically secure topic id using ``xkcdpass``.
+    Generate a cryptographically secure topic id from ``xkcdpass``'s word list.
+    Words are drawn with ``secrets.choice``, as ``xkcdpass`` does with
+    ``random.SystemRandom``.
     See https://xkcd.com/936/ for illustration
 
     Returns:
         str: dash-separated topic id
     """
-    wordfile = xp.locate_wordfile()
-    words = xp.generate_wordlist(wordfile=wordfile, min_length=3, max_length=6)
-    return "-".join(xp.generate_xkcdpassword(words, numwords=4).split())
+    words = _topic_words()
+    return "-".join(secrets.choice(words) for _ in range(4))
+
+
+@lru_cache(maxsize=256)
+def _shorten(path: str, sep: str) -> str:
+    """
+    Shortens a path string to its 2 first and 3 last parts.
+
+    Args:
+        path (str): The path to shorten.
+        sep (str): The path separator.
+
+    Returns:
+        str: The shortened path, *e.g.* ``/Users/.../repo/dir/.ntfy.conf``
+    """
+    # slices around separator positions: no parts list or re-join
+    if path.count(sep) < 5:
+        return path
+    head = path.find(sep, path.find(sep) + 1)
+    tail = path.rfind(sep, 0, path.rfind(sep, 0, path.rfind(sep)))
+    return path[:head] + sep + "..." + path[tail:]
+
+
+def code_str(value: Any) -> str:
+    """
+    Wraps an object's string representation in a ``rich`` ``code`` block.
+
+    Args:
+        value (Any): Object to convert to string and wrap in
+            a ``rich`` ``code`` block.
+
+    Returns:
+        str: Code-wrapped value: ``[code]{str(value)}[/code]``
+    """
+    return f"[code]{value}[/code]"
+
+
+def code_path(path: Union[str, PurePath]) -> str:
+    """
+    Shortens a path to its 2 first and 3 last parts and wraps it in a ``rich``
+    ``code`` block.
+
+    Args:
+        path (Union[str, PurePath]): The path to wrap in a ``rich`` ``code`` block.
+
+    Returns:
+        str: Code-wrapped shortened path.
+    """
+    return f"[code]{_shorten(str(path), os.sep)}[/code]"
 
 
 def code(value: Any) -> str:
@@ -187,6 +449,8 @@ def code(value: Any) -> str:
     Turns an object into a string and wraps it in a ``rich`` ``code`` block.
     A pathlib Path will be shortened to the 3 last parts of the path.
 
+    Prefer ``code_str`` or ``code_path`` when the type of ``value`` is known.
+
     Args:
         value (Any): Object to convert to string and wrap in
             a ``rich`` ``code`` block.
@@ -194,7 +458,6 @@ def code(value: Any) -> str:
     Returns:
         str: Code-wrapped value: ``[code]{str(value)}[/code]``
     """
-    if isinstance(value, Path):
-        if len(value.parts) > 3:
-            value = Path(*value.parts[:2], "...", *value.parts[-3:])
-    return f"[code]{str(value)}[/code]"
+    if isinstance(value, PurePath):
+        return code_path(value)
+    return code_str(value)
@@ -0,0 +1,106 @@
+import typer
+from typer.testing import CliRunner
+
+from ntfy_wrapper import utils
+from ntfy_wrapper.cli import app
+from ntfy_wrapper.notifier import Notifier
+from ntfy_wrapper.utils import default_conf, load_conf, write_conf
+
+runner = CliRunner()
+
+
+def _sent_targets(monkeypatch):
+    """
+    Replaces the HTTP dispatch with a stub recording the targets it receives.
+    """
+    sent = []
+
+    def dispatch(self, targets, bodies, headers, use_PUT=False, debug=False):
+        sent.extend(targets)
+        return [dest for _, _, dest in targets]
+
+    monkeypatch.setattr(Notifier, "_dispatch", dispatch)
+    return sent
+
+
+def _conf(tmp_path):
+    conf_path = tmp_path / ".ntfy.conf"
+    write_conf(
+        conf_path,
+        {**default_conf(), "topics": ["conf-topic"], "base_url": ["https://ntfy.sh"]},
+    )
+    return conf_path
+
+
+def test_send_without_targets_uses_the_configuration(tmp_path, monkeypatch):
+    sent = _sent_targets(monkeypatch)
+    result = runner.invoke(app, ["send", "hello", "--conf-path", str(_conf(tmp_path))])
+    assert result.exit_code == 0, result.output
+    assert sent == [("https://ntfy.sh", "topic", "conf-topic")]
+
+
+def test_send_with_repeated_topics(tmp_path, monkeypatch):
+    sent = _sent_targets(monkeypatch)
+    result = runner.invoke(
+        app,
+        ["send", "hello", "--conf-path", str(_conf(tmp_path)), "-t", "a", "-t", "b,c"],
+    )
+    assert result.exit_code == 0, result.output
+    assert [dest for _, _, dest in sent] == ["a", "b", "c"]
+
+
+def _batch(conf_path, operations):
+    ops_path = conf_path.parent / "operations.txt"
+    ops_path.write_text(operations)
+    # standalone_mode=False: usage errors are raised instead of being rendered
+    return runner.invoke(
+        app,
+        ["batch", str(ops_path), "--conf-path", str(conf_path)],
+        standalone_mode=False,
+    )
+
+
+def test_batch_applies_all_operations_with_a_single_write(tmp_path, monkeypatch):
+    conf_path = _conf(tmp_path)
+    writes = []
+
+    def counting_write_conf(path, conf):
+        writes.append(path)
+        write_conf(path, conf)
+
+    monkeypatch.setattr(utils, "write_conf", counting_write_conf)
+    result = _batch(
+        conf_path,
+        "# comment\n"
+        + "add topic a\n"
+        + "\n"
+        + "add email you@foo.bar\n"
+        + "remove topic conf-topic\n"
+        + "add default priority 4\n"
+        + "remove default tags\n",
+    )
+    assert result.exit_code == 0, result.output
+    assert len(writes) == 1
+    conf = load_conf(conf_path)
+    assert conf["topics"] == ["a"]
+    assert conf["emails"] == ["you@foo.bar"]
+    assert conf["priority"] == "4"
+    assert "tags" not in conf
+
+
+def test_batch_invalid_line_leaves_the_file_untouched(tmp_path):
+    conf_path = _conf(tmp_path)
+    before = conf_path.read_bytes()
+    result = _batch(conf_path, "add topic a\nadd nothing b\n")
+    assert isinstance(result.exception, typer.BadParameter)
+    assert "line 2" in str(result.exception)
+    assert conf_path.read_bytes() == before
+
+
+def test_batch_rejects_add_default_without_value(tmp_path):
+    conf_path = _conf(tmp_path)
+    before = conf_path.read_bytes()
+    result = _batch(conf_path, "add topic a\nadd default title   \n")
+    assert isinstance(result.exception, typer.BadParameter)
+    assert "line 2" in str(result.exception)
+    assert conf_path.read_bytes() == before
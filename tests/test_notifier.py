@@ -0,0 +1,38 @@
+from ntfy_wrapper.notifier import Notifier
+
+
+class _RecordingSession:
+    """
+    Stands in for ``requests.Session``, recording the requests it receives.
+    """
+
+    def __init__(self):
+        self.requests = []
+
+    def post(self, url, data=None, headers=None):
+        self.requests.append((url, data, headers))
+
+
+def test_notify_many_sends_every_message_in_order(tmp_path, monkeypatch):
+    session = _RecordingSession()
+    monkeypatch.setattr(Notifier, "_get_session", lambda self: session)
+    notifier = Notifier(
+        topics=["a", "b"],
+        emails="you@foo.bar",
+        conf_path=tmp_path,
+        warnings=False,
+        verbose=False,
+    )
+
+    dests = notifier.notify_many(["1", "2", "3"], title="Batch")
+
+    assert dests == ["a", "b", "you@foo.bar"]
+    received = {}
+    for url, data, headers in session.requests:
+        assert headers["Title"] == "Batch"
+        received.setdefault((url, headers.get("Email")), []).append(data)
+    assert received == {
+        ("https://ntfy.sh/a", None): [b"1", b"2", b"3"],
+        ("https://ntfy.sh/b", None): [b"1", b"2", b"3"],
+        ("https://ntfy.sh/alerts", "you@foo.bar"): [b"1", b"2", b"3"],
+    }
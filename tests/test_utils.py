@@ -0,0 +1,70 @@
+import configparser
+
+import pytest
+
+from ntfy_wrapper.utils import DOCSTRING, _parse_ini, load_conf
+
+
+def _configparser_write(conf_path, conf):
+    """
+    Writes ``conf`` the way ``write_conf`` did when it relied on ``configparser``.
+    """
+    config = configparser.ConfigParser(allow_no_value=True)
+    config.add_section("about")
+    for line in DOCSTRING.split("\n")[1:]:
+        config.set("about", ("# " + line).strip())
+    config.add_section("notifier_init")
+    for k in ("topics", "emails", "base_url"):
+        if conf.get(k):
+            config.set("notifier_init", k, ",".join(conf[k]))
+    config.add_section("notify_defaults")
+    for k, v in conf.items():
+        if k not in ("topics", "emails", "base_url"):
+            config.set("notify_defaults", k, v)
+    with conf_path.open("w", encoding="utf-8") as f:
+        config.write(f)
+
+
+def _configparser_sections(conf_path):
+    config = configparser.ConfigParser()
+    config.read(conf_path, encoding="utf-8")
+    return {name: dict(config[name]) for name in config.sections()}
+
+
+def test_parse_ini_matches_configparser(tmp_path):
+    conf_path = tmp_path / ".ntfy.conf"
+    _configparser_write(
+        conf_path,
+        {
+            "topics": ["a", "b"],
+            "emails": ["you@foo.bar"],
+            "base_url": ["https://ntfy.sh", "https://ntfy.example.com"],
+            "title": "Title: with = delimiters",
+            "actions": "view, Open, https://a.io\n\nhttp, Close, https://b.io",
+        },
+    )
+    text = conf_path.read_text(encoding="utf-8")
+    assert _parse_ini(text) == _configparser_sections(conf_path)
+
+    conf = load_conf(conf_path)
+    assert conf["topics"] == ["a", "b"]
+    assert conf["actions"] == "view, Open, https://a.io\n\nhttp, Close, https://b.io"
+
+
+def test_parse_ini_continuation_lines():
+    sections = _parse_ini("[notifier_init]\ntopics = a,\n  b\n\n# comment\n")
+    assert sections == {"notifier_init": {"topics": "a,\nb"}}
+
+
+@pytest.mark.parametrize(
+    "text", ["topics = a\n[notifier_init]\n", "[notifier_init]\ntopics\n"]
+)
+def test_parse_ini_rejects_malformed_lines(text):
+    with pytest.raises(ValueError):
+        _parse_ini(text)
+
+
+def test_load_conf_with_byte_order_mark(tmp_path):
+    conf_path = tmp_path / ".ntfy.conf"
+    conf_path.write_bytes(b"\xef\xbb\xbf[notifier_init]\ntopics = a,b\n")
+    assert load_conf(conf_path)["topics"] == ["a", "b"]